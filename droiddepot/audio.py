@@ -57,7 +57,7 @@ class DroidAudioCommand(IntEnum):
     DisableHeadLeds = 74
     EnableHeadLeds = 75
 
-class DroidLedIdentifier(object):
+class DroidLedIdentifier(IntEnum):
     """
     Constants relating to various Leds found in droid depot droids.
     """
@@ -133,11 +133,11 @@ class DroidAudioController(object):
         if volume:
             await self.set_volume(volume)
 
-        bank_id = bank_id - 1 if bank_id != None else 0
+        bank_id = bank_id - 1 if bank_id is not None else 0
         if bank_id and (not hasattr(self, "sound_bank") or self.sound_bank != bank_id):
             await self.set_audio_bank(bank_id)
 
-        sound_id = int_to_hex(sound_id - 1 if sound_id != None else 0)
+        sound_id = int_to_hex(sound_id - 1 if sound_id is not None else 0)
         bank_id = int_to_hex(bank_id)
 
         audio_command = "00"
@@ -170,7 +170,7 @@ class DroidAudioController(object):
             bank_id (int): The ID of the audio bank to select.
         """
 
-        bank_id = int_to_hex(bank_id if bank_id != None else 0)
+        bank_id = int_to_hex(bank_id if bank_id is not None else 0)
         self.sound_bank = bank_id
 
         await self.execute_audio_command(DroidAudioCommand.SetSelectedSoundBank, bank_id)
@@ -183,7 +183,7 @@ class DroidAudioController(object):
             volume_level (int): The volume level to set.
         """
 
-        volume_level = int_to_hex(volume_level if volume_level != None else 0)
+        volume_level = int_to_hex(volume_level if volume_level is not None else 0)
         await self.execute_audio_command(DroidAudioCommand.SetVolume, volume_level)
 
     async def reset_head_leds(self) -> None:
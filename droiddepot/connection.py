@@ -50,6 +50,7 @@ class DroidConnection(object):
             motor_controller: An instance of the DroidMotorController class.
             heartbeat_loop: An asyncio event loop used for the heartbeat thread.
             heartbeat_thread: A thread that runs the heartbeat_loop.
+            command_characteristic: The droid's command characteristic. Resolved once on connect.
         """
         
         self.profile = profile
@@ -66,6 +67,8 @@ class DroidConnection(object):
 
         self.heartbeat_loop = asyncio.new_event_loop()
         self.heartbeat_thread = None
+        self.command_characteristic = DroidBluetoothCharacteristics.DroidCommandCharacteristic
+        self.__disconnected_event = None
 
     async def connect(self, silent: bool = False) -> None:
         """
@@ -73,12 +76,18 @@ class DroidConnection(object):
         """
 
         timeout = 0.0
-        self.droid = BleakClient(self.profile)
+        self.__disconnected_event = asyncio.Event()
+        self.droid = BleakClient(self.profile, disconnected_callback=self.__handle_disconnected)
         await self.droid.connect()
         await self.droid.start_notify(DroidBluetoothCharacteristics.DroidNotifyCharacteristic, self.notification_handler)
 
+        # Resolve the command characteristic once so each write skips the service lookup
+        command_characteristic = self.droid.services.get_characteristic(DroidBluetoothCharacteristics.DroidCommandCharacteristic)
+        if command_characteristic is not None:
+            self.command_characteristic = command_characteristic
+
         while not self.droid.is_connected and timeout < 10:
-            sleep (.1)
+            await asyncio.sleep(.1)
             timeout += .1
 
         connect_code = bytearray.fromhex("222001")
@@ -93,7 +102,7 @@ class DroidConnection(object):
         
         if not silent:
             await self.script_engine.execute_script(DroidScripts.DroidPairingSequence1)
-            sleep(4)
+            await asyncio.sleep(4)
 
         self.heartbeat_thread = Thread(target=self.__start_heartbeat_loop, args=(self.heartbeat_loop,), daemon=True)
         self.heartbeat_thread.start()
@@ -107,6 +116,25 @@ class DroidConnection(object):
         await self.connect()
         return self
 
+    def __handle_disconnected(self, client: BleakClient) -> None:
+        """
+        Called by bleak when the connection to the droid is lost or closed.
+        """
+
+        logging.info("Droid disconnected: [ %s ]" % client.address)
+        self.__disconnected_event.set()
+
+    async def wait_for_disconnect(self) -> None:
+        """
+        Waits until the connection to the droid has been closed. Returns immediately
+        if the droid is not connected.
+        """
+
+        if self.__disconnected_event is None:
+            return
+        
+        await self.__disconnected_event.wait()
+
     async def notification_handler(self, sender: object, data: bytearray) -> None:
         """
         Processes notification events from the connected droid and
@@ -151,7 +179,7 @@ class DroidConnection(object):
         finally:
             await self.droid.disconnect()
 
-            if self.heartbeat_loop != None:
+            if self.heartbeat_loop is not None:
                 self.heartbeat_loop.stop()
 
     async def __aexit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
@@ -214,7 +242,7 @@ class DroidConnection(object):
 
         command = self.build_droid_command(command_id, data)
         logging.debug('Sending command: %s' % command.hex())
-        await self.droid.write_gatt_char(DroidBluetoothCharacteristics.DroidCommandCharacteristic, bytearray.fromhex(command.hex()))
+        await self.droid.write_gatt_char(self.command_characteristic, command, response=False)
 
     async def send_droid_multi_command(self, command_id: int, data: str = "") -> None:
         """
@@ -239,7 +267,7 @@ class DroidConnection(object):
 
         await self.send_droid_command(DroidCommandId.RetrieveFirmwareInformation)
         firemware_information = await self.notify_processor.wait_for_command_response(DroidCommandId.RetrieveFirmwareInformationResponse)
-        if firemware_information == None:
+        if firemware_information is None:
             raise Exception('Failed to retrieve firmware information. No response given')
         return firemware_information
 
@@ -303,7 +331,7 @@ async def discover_droids(retry: bool = False) -> list:
 
             for possible_droid_address in possible_droids:
                 ble_device, advertising_data = possible_droids[possible_droid_address]
-                manufacturer_ids = list(advertising_data.manufacturer_data.keys()) if advertising_data.manufacturer_data != None else []
+                manufacturer_ids = list(advertising_data.manufacturer_data.keys()) if advertising_data.manufacturer_data is not None else []
 
                 if ble_device.name == "DROID" and DisneyBLEManufacturerId.DroidManufacturerId in manufacturer_ids:
                     droids.append((ble_device, advertising_data.manufacturer_data))
@@ -325,6 +353,38 @@ async def discover_droids(retry: bool = False) -> list:
     
     return droid_connections
 
+async def find_droid(address: str, timeout: float = 2.0) -> DroidConnection:
+    """
+    Scans for a previously discovered droid by its Bluetooth address. This allows applications to cache a droid's
+    address and reconnect to it without performing a full discovery scan.
+
+    Args:
+        address (str): The Bluetooth address of the droid
+        timeout (float): The maximum time to scan for the droid, in seconds.
+
+    Returns:
+        a DroidConnection object representing the droid if it was found advertising. Otherwise None
+    """
+
+    manufacturer_data = {}
+
+    def is_cached_droid(ble_device: object, advertising_data: object) -> bool:
+        if ble_device.address.upper() != address.upper() or advertising_data.manufacturer_data is None:
+            return False
+        
+        if DisneyBLEManufacturerId.DroidManufacturerId not in advertising_data.manufacturer_data:
+            return False
+
+        manufacturer_data.update(advertising_data.manufacturer_data)
+        return True
+
+    ble_device = await BleakScanner.find_device_by_filter(is_cached_droid, timeout=timeout)
+    if ble_device is None:
+        return None
+    
+    logging.info(f"Droid successfully found: [ {ble_device} ]")
+    return DroidConnection(ble_device, manufacturer_data)
+
 async def discover_droid(retry: bool = False) -> DroidConnection:
     """
     Scans for nearby Bluetooth devices manufactured by Disney and have the device name of "DROID" and returns if found. If retry is True, the function will
@@ -5,9 +5,11 @@ See LICENSE file in the project root for full license information.
 This modules defines classes and helper functions for working with SWGE droid hardware. 
 """
 
+from enum import IntEnum
+
 DroidFirmwareVersion = '4b1001444411110100000000'
 
-class DroidAudioBankIdentifier(object):
+class DroidAudioBankIdentifier(IntEnum):
     """
     A collection of identifiers used to represent available audio banks of a droid or its connected personality chip. 
     These are used in audio playback.
@@ -26,14 +28,15 @@ class DroidAudioBankIdentifier(object):
     BlasterAcessoryAudioBank = 11
     ThrusterAccessoryAudioBank = 12
 
-    TalkingBanks = [
-        DroidDepotAudioBank,
-        ResistenceAudioBank,
-        UnknownAudioBank,
-        DokOndarsAudioBank,
-        FirstOrderAudioBank]
+# Assigned after class creation so the list is not turned into an enum member
+DroidAudioBankIdentifier.TalkingBanks = [
+    DroidAudioBankIdentifier.DroidDepotAudioBank,
+    DroidAudioBankIdentifier.ResistenceAudioBank,
+    DroidAudioBankIdentifier.UnknownAudioBank,
+    DroidAudioBankIdentifier.DokOndarsAudioBank,
+    DroidAudioBankIdentifier.FirstOrderAudioBank]
 
-class DroidAffiliation(object):
+class DroidAffiliation(IntEnum):
     """
     Represents a droid's affiliation for BLE interactions and audio playback.
     """
@@ -137,7 +140,15 @@ class DroidPersonalityIdentifier(object):
         BBUnit: (DroidAudioBankIdentifier.FirstOrderAudioBank, 3),
     }
 
-class DroidLedIdentifier(object):
+_DEFAULT_SHUTDOWN = (DroidAudioBankIdentifier.FirstOrderAudioBank, 1)
+
+# Flattened copy of ChipAudioCount keyed by (bank_id, personality_id)
+_FLAT_AUDIO_COUNT = {
+    (bank_id, personality_id): count
+    for bank_id, bank_counts in DroidPersonalityIdentifier.ChipAudioCount.items()
+    for personality_id, count in bank_counts.items()}
+
+class DroidLedIdentifier(IntEnum):
     """
     A collection of LED identifiers for a droid.
 
@@ -159,7 +170,7 @@ class DroidLedIdentifier(object):
         BUnitLED2Red (int): Identifier for LED 2 red on a BD unit.
         BUnitLED3Blue (int): Identifier for LED 3 blue on a BD unit.
         BUnitLED3Green (int): Identifier for LED 3 green on a BD unit.
-        BUnitLED3Blue (int): Identifier for LED 3 blue on a BD unit.
+        BUnitLED3Red (int): Identifier for LED 3 red on a BD unit.
         BUnitLeftEyeLed (int): Identifier for the left eye LED on a BD unit.
         BUnitRightEyeLed (int): Identifier for the right eye LED on a BD unit.
     """
@@ -186,7 +197,7 @@ class DroidLedIdentifier(object):
     BUnitLED2Red = 8
     BUnitLED3Blue = 9
     BUnitLED3Green = 10
-    BUnitLED3Blue = 11
+    BUnitLED3Red = 11
     BUnitLeftEyeLed = 12
     BUnitRightEyeLed = 13
 
@@ -202,7 +213,7 @@ def get_personality_id(droid_id: int, chip_id: int = None) -> int:
         an integer representing the droid's personality that can be used for audio queries.
     """
 
-    return droid_id if chip_id == None else chip_id
+    return droid_id if chip_id is None else chip_id
 
 def get_available_audio_in_bank(bank_id: int, personality_id: int) -> int:
     """
@@ -216,11 +227,7 @@ def get_available_audio_in_bank(bank_id: int, personality_id: int) -> int:
         an integer representing the total number of available audio clips
     """
 
-    if bank_id not in DroidPersonalityIdentifier.ChipAudioCount:
-        return 0
-    
-    bank_info = DroidPersonalityIdentifier.ChipAudioCount[personality_id]
-    return 0 if personality_id not in bank_info else bank_info[personality_id]
+    return _FLAT_AUDIO_COUNT.get((bank_id, personality_id), 0)
 
 def get_shutdown_audio_track(affiliation_id: int) -> tuple:
     """
@@ -235,10 +242,7 @@ def get_shutdown_audio_track(affiliation_id: int) -> tuple:
         default is returned of (7, 1).
     """
 
-    if affiliation_id not in DroidPersonalityIdentifier.ChipShutdownTrack:
-        return (DroidAudioBankIdentifier.FirstOrderAudioBank, 1)
-    
-    return DroidPersonalityIdentifier.ChipShutdownTrack[affiliation_id]
+    return DroidPersonalityIdentifier.ChipShutdownTrack.get(affiliation_id, _DEFAULT_SHUTDOWN)
 
 def get_personality_affiliation(personality_id: int) -> int:
     """
@@ -6,10 +6,10 @@ This module provides classes for controlling the motor functions of a SWGE Droid
 """
 
 from enum import IntEnum
-from droiddepot.utils import int_to_hex
+from droiddepot.utils import int_to_hex, int_to_hex_bytes
 from droiddepot.protocol import DroidCommandId, DroidMultipurposeCommand
 
-class DroidMotorDirection(object):
+class DroidMotorDirection(IntEnum):
     """
     Enumeration of motor directions.
     """
@@ -20,6 +20,8 @@ class DroidMotorDirection(object):
     Left = 0
     Right = 8
 
+_HEAD_DIRECTIONS = frozenset((DroidMotorDirection.Forward, DroidMotorDirection.Backwards))
+
 class DroidMotorIdentifier(IntEnum):
     """
     Enumeration of motor identifiers.
@@ -54,29 +56,28 @@ class DroidMotorController(object):
         """
 
         self.droid = droid
-        self.__motor_event_handlers = []
+        self.__motor_event_handlers = {}
 
     def subscribe_runit_head_motor_events(self, handler: object) -> None:
         """
         """
 
-        if handler not in self.__motor_event_handlers:
-            self.__motor_event_handlers.append(handler)
+        self.__motor_event_handlers[handler] = None
 
     def unsubscribe_runit_head_motor_events(self, handler: object) -> None:
         """
 
         """
 
-        if handler in self.__motor_event_handlers:
-            self.__motor_event_handlers.remove(handler)
+        self.__motor_event_handlers.pop(handler, None)
 
     async def process_runit_head_motor_event(self, event_id: int) -> None:
         """
         """
 
-        for handler in self.__motor_event_handlers:
-            handler(DroidMotorEvent(event_id))
+        event = DroidMotorEvent(event_id)
+        for handler in tuple(self.__motor_event_handlers):
+            handler(event)
         
     async def stop_all_motors(self) -> None:
         """
@@ -98,14 +99,8 @@ class DroidMotorController(object):
             ramp_speed (int): An integer representing the motor ramp speed. Defaults to 300.
         """
 
-        delay_hex = int_to_hex(delay)
-        if len(delay_hex) < 4:
-            missing = 4 - len(delay_hex)
-            for x in range(missing):
-                delay_hex = '0' + delay_hex
-
-        motor_select = "%s%d" % (direction, motor_id)
-        motor_command = "%s%s%s%s" % (motor_select, int_to_hex(speed), int_to_hex(ramp_speed), delay_hex)
+        motor_select = "%d%d" % (direction, motor_id)
+        motor_command = "%s%s%s%s" % (motor_select, int_to_hex(speed), int_to_hex_bytes(ramp_speed, 2), int_to_hex_bytes(delay, 2))
         await self.droid.send_droid_command(DroidCommandId.SetMotorSpeed, motor_command)
 
     async def set_drive_speed(self, direction: int, speed: int = 160, ramp_speed: int = 300) -> None:
@@ -144,11 +139,11 @@ class DroidMotorController(object):
             ramp_speed (int): An integer representing the rotation ramp speed. Defaults to 300.
         """
 
-        if (direction != DroidMotorDirection.Forward and direction != DroidMotorDirection.Backwards):
+        if direction not in _HEAD_DIRECTIONS:
             raise ValueError("Direction is invalid. Expected values are 0 (Forward/Left) and 8 (Backwards/Right)")
 
         dir_hex = "00" if direction == DroidMotorDirection.Forward else "FF"
-        command_data = "%s%s%s0000" % (dir_hex, int_to_hex(speed), int_to_hex(ramp_speed))
+        command_data = "%s%s%s0000" % (dir_hex, int_to_hex(speed), int_to_hex_bytes(ramp_speed, 2))
 
         await self.droid.send_droid_multi_command(DroidMultipurposeCommand.RotateBUnitHead, command_data)
         await self.droid.send_droid_multi_command(DroidMultipurposeCommand.RotateRUnitHead, command_data)
@@ -12,6 +12,7 @@ incoming messages and verifying firmware versions.
 
 import logging
 import asyncio
+from collections import deque
 from droiddepot.utils import hex_to_int
 from droiddepot.hardware import DroidFirmwareVersion
 from droiddepot.protocol import *
@@ -28,6 +29,8 @@ class DroidNotifyMessage(object):
         message_data (str): The data associated with the notification.
     """
 
+    __slots__ = ('message_size', 'unknown1', 'command_id', 'unknown3', 'message_data')
+
     def __init__(self, message_size: int, unknown1: int, command_id: int, unknown3: int, message_data: str):
         """
         Initializes a new instance of the DroidNotifyMessage class.
@@ -93,9 +96,7 @@ class DroidNotificationProcessor(object):
 
         # Queue our callback Queue for handling
         callback_queue = asyncio.Queue()
-        if command_id not in self.__pending_callback_events:
-            self.__pending_callback_events[command_id] = []
-        self.__pending_callback_events[command_id].append(callback_queue)
+        self.__pending_callback_events.setdefault(command_id, deque()).append(callback_queue)
 
         # Wait for our response from the droid
         try:
@@ -114,12 +115,14 @@ class DroidNotificationProcessor(object):
             DroidNotifyMessage: A DroidNotifyMessage instance representing the incoming message.
         """
 
-        hex_data = data.hex()
-        message_size = hex_to_int(hex_data[:2]) - 0x1f
-        unknown1 = hex_to_int(hex_data[2:4])
-        command_id = hex_to_int(hex_data[4:6])
-        unknown3 = hex_to_int(hex_data[6:8])
-        message_data = hex_data[8:]
+        if len(data) < 4:
+            raise ValueError('Received truncated packet. Expected at least 4 bytes, got %s' % len(data))
+
+        message_size = data[0] - 0x1f
+        unknown1 = data[1]
+        command_id = data[2]
+        unknown3 = data[3]
+        message_data = data[4:].hex()
 
         if len(data) != message_size:
             raise ValueError('Received truncated packet. Expected %s, got %s' % (len(data), message_size))
@@ -151,16 +154,13 @@ class DroidNotificationProcessor(object):
             response (object): The response object to be passed to the callbacks.
         """
 
-        if message.command_id not in self.__pending_callback_events:
+        pending_callback_events = self.__pending_callback_events.get(message.command_id)
+        if not pending_callback_events:
             return
         
-        command_id = message.command_id
-        if not len(self.__pending_callback_events[command_id]):
-            return
+        first_callback_event = pending_callback_events.popleft()
         
-        first_callback_event = self.__pending_callback_events[command_id][0]
         await first_callback_event.put(response)
-        self.__pending_callback_events[command_id].remove(first_callback_event)
 
     async def __process_incoming_message(self, message: DroidNotifyMessage) -> None:
         """
@@ -171,19 +171,20 @@ class DroidNotificationProcessor(object):
             message (DroidNotifyMessage): The parsed command message received from the droid.
         """
 
-        if not DroidCommandId.valid_command(message.command_id):
+        command = DroidCommandId._value2member_map_.get(message.command_id)
+        if command is None:
             logging.warning('Received unknown command %s. Ignoring' % message.command_id)
             return
         
         response = None
-        if message.command_id == DroidCommandId.RetrieveFirmwareInformationResponse:
+        if command is DroidCommandId.RetrieveFirmwareInformationResponse:
             response = await self.__verify_firmware_version(message)
-        elif message.command_id == DroidCommandId.RUnitHeadEvent:
+        elif command is DroidCommandId.RUnitHeadEvent:
             response = await self.__handle_runit_head_motor_events(message)
         else:
-            logging.warning('No handler present for droid command: %s (%s)' % (DroidCommandId(message.command_id).name, message.message_data))
+            logging.warning('No handler present for droid command: %s (%s)' % (command.name, message.message_data))
 
-        if response == None:
+        if response is None:
             response = message.message_data
         await self.__handle_pending_callbacks(message, response)
 
@@ -7,8 +7,9 @@ define the constant command identifiers to communicate with a SWGE droid.
 """
 
 from enum import IntEnum
+from droiddepot.hardware import DroidAffiliation
 
-class DisneyBLEManufacturerId(object):
+class DisneyBLEManufacturerId(IntEnum):
     """
     Constants representing the types of BLE beacons found in Disney parks.
     """
@@ -60,9 +61,11 @@ class DroidCommandId(IntEnum):
         Checks if the command id is valid
         """
 
-        return value in cls._value2member_map_ 
+        return value in _VALID_COMMAND_IDS
 
-class DroidMultipurposeCommand(object):
+_VALID_COMMAND_IDS = frozenset(DroidCommandId._value2member_map_)
+
+class DroidMultipurposeCommand(IntEnum):
     """
     A class representing the available multipurpose commands.
 
@@ -80,13 +83,4 @@ class DroidMultipurposeCommand(object):
     RotateRUnitHead = 2
     RotateRUnitHeadWithoutRamp = 3
     RotateBUnitHead = 4
-    DriveBUnit = 5
-
-class DroidAffiliation(object):
-    """
-    Represents a droid's affiliation for BLE interactions and audio playback.
-    """
-
-    Scoundrel = 1
-    Resistenace = 5
-    FirstOrder = 9
\ No newline at end of file
+    DriveBUnit = 5
\ No newline at end of file
@@ -10,11 +10,15 @@ This module contains classes and functions for interacting with droid scripts.
 """
 
 import asyncio
+import functools
 import logging
-from datetime import datetime
-from dbeacon import scanner, beacon
+import time
+from typing import TYPE_CHECKING
 from droiddepot.protocol import DroidCommandId
 
+if TYPE_CHECKING:
+    from dbeacon import beacon
+
 class DroidScripts(object):
     """
     An enumeration containing constants representing available droid scripts.
@@ -34,6 +38,9 @@ class DroidScripts(object):
     DroidPairingSequence2 = 12
     FullThrottleTestScript = 13
 
+# Built in scripts that are unsafe to run on a droid
+_DANGEROUS_SCRIPT_IDS = frozenset((DroidScripts.FullThrottleTestScript,))
+
 class DroidScriptActions(object):
     """
     An enumeration containing constants representing available droid script actions.
@@ -43,6 +50,27 @@ class DroidScriptActions(object):
     CloseScript = 1
     ExecuteScript = 2
 
+# Preformatted command data for every two digit script id and script action
+_SCRIPT_COMMAND_DATA = {
+    (script_id, script_action): f"{script_id:02d}{script_action:02d}"
+    for script_id in range(100)
+    for script_action in (DroidScriptActions.OpenScript, DroidScriptActions.CloseScript, DroidScriptActions.ExecuteScript)}
+
+@functools.lru_cache(maxsize=64)
+def _reaction_time_seconds(interval: int) -> int:
+    """
+    Calculates the time in seconds from a park beacon's reaction interval.
+
+    Args:
+        interval (int): Reaction interval received from a location beacon
+    """
+
+    interval = interval * 5
+    if interval < 60:
+        interval = 60
+
+    return interval
+
 class DroidScriptEngine(object):
     """
     A class that represents the droid script engine and provides methods for executing droid scripts.
@@ -58,9 +86,13 @@ class DroidScriptEngine(object):
 
         self.droid = droid
 
-        self.__location_reaction_tracker = {}
+        self.__location_cooldown_until = {}
+        self.__reaction_semaphore = asyncio.Semaphore(4)
+        self.__reaction_tasks = set()
+        # dbeacon probes the BLE backend on import so it is only loaded once an engine is created
+        from dbeacon import scanner
         self.reaction_scanner = scanner.DBeaconScanner()
-        self.reaction_scanner.add_beacon_handler(10, self.__perform_location_reactions)
+        self.reaction_scanner.add_beacon_handler(10, self.__queue_location_reactions)
 
     async def send_script_command(self, script_id: int, script_action: int) -> None:
         """
@@ -78,10 +110,12 @@ class DroidScriptEngine(object):
         if script_id <= 0 and script_action != DroidScriptActions.CloseScript:
             raise ValueError("Invalid script id requested. Script ids must be larger then 0")
 
-        if script_id == 13:
+        if script_id in _DANGEROUS_SCRIPT_IDS:
             raise ValueError("Attempted to use a dangerous script. Execution denied")
 
-        command_data = "%s%s" % ("{:02d}".format(script_id), "{:02d}".format(script_action))
+        command_data = _SCRIPT_COMMAND_DATA.get((script_id, script_action))
+        if command_data is None:
+            command_data = f"{script_id:02d}{script_action:02d}"
         await self.droid.send_droid_command(DroidCommandId.ScriptActionComand, command_data)
 
     async def execute_script(self, script_id: int) -> None:
@@ -105,7 +139,7 @@ class DroidScriptEngine(object):
 
         return DroidScriptProgrammer(self.droid, script_id)
 
-    async def execute_location_beacon(self, beacon: beacon.LocationBeacon) -> None:
+    async def execute_location_beacon(self, beacon: 'beacon.LocationBeacon') -> None:
         """
         Executes a location beacon on the connected droid emulation what would happen
         if the droid encountered the beacon at a Disney park
@@ -129,61 +163,61 @@ class DroidScriptEngine(object):
         
         await self.execute_script(location_id)
 
-    def __calculate_reaction_time(self, interval: int) -> int:
+    async def __queue_location_reactions(self, beacons: list) -> None:
         """
-        Calculates the time in seconds from a park beacon's reaction interval.
+        Hands the detected beacons off to a background task so the beacon scanner
+        can continue scanning while the reactions are sent to the droid.
 
         Args:
-            interval (int): Reaction interval received from a location beacon
+            beacons (list): A list of beacons detected
         """
 
-        interval = interval * 5
-        if interval < 60:
-            interval = 60
+        task = asyncio.create_task(self.__guarded_location_reactions(beacons))
+        self.__reaction_tasks.add(task)
+        task.add_done_callback(self.__reaction_tasks.discard)
 
-        return interval
+    async def __guarded_location_reactions(self, beacons: list) -> None:
+        """
+        Performs location reactions while limiting how many scan results are processed at once.
+
+        Args:
+            beacons (list): A list of beacons detected
+        """
+
+        async with self.__reaction_semaphore:
+            await self.__perform_location_reactions(beacons)
 
     async def __perform_location_reactions(self, beacons: list) -> None:
         """
-        Executes a script associated with each park location beacon that the droid enters.
+        Executes the script associated with the first park location beacon that the droid
+        is not already reacting to. Like the droid firmware only one reaction is performed per scan.
 
         Args:
-            locations (list): A list of beacons detected
-
-        Returns:
-            int: The calculated reaction time in seconds.
+            beacons (list): A list of (address, beacon) tuples detected
         """
 
         # Verify we have at least one location to react to first.
         if len(beacons) == 0:
             return
         
-        can_execute = True
-        already_executed = False
-        location_beacon_address = "Unknown"
-
+        now = time.monotonic()
         for location_beacon_info in beacons:
+            location_beacon_address = "Unknown"
             try:
                 location_beacon_address, location_beacon = location_beacon_info
 
-                # Check if we already reacted and if we have check if we are in a new reaction window
-                if location_beacon_address in self.__location_reaction_tracker:
-                    last_execution = self.__location_reaction_tracker[location_beacon_address]
-                    time_since_last = (datetime.now() - last_execution).total_seconds()
-                    can_execute = time_since_last >= self.__calculate_reaction_time(location_beacon.reaction_interval)
-
-                # Attempt to execute the reaction
-                if can_execute and already_executed == False:
-                    await self.execute_location_reaction(location_beacon.location_id)
-                    self.__location_reaction_tracker[location_beacon_address] = datetime.now()
-                    already_executed = True
+                # Skip beacons we already reacted to that are still inside their reaction window
+                if self.__location_cooldown_until.get(location_beacon_address, 0) > now:
+                    continue
+
+                # Mark the reaction before sending it so overlapping scans do not repeat it
+                self.__location_cooldown_until[location_beacon_address] = now + _reaction_time_seconds(location_beacon.reaction_interval)
+                await self.execute_location_reaction(location_beacon.location_id)
+                break
             except Exception as e:
                 logging.error('An unexpected error occured processing a park location beacon: %s' % location_beacon_address)
                 logging.error(e, exc_info=True) 
 
-        if already_executed:
-            await asyncio.sleep(5)
-
     def start_beacon_reactions(self) -> None:
         """
         Enables SWGE park beacon reactions similar to the internal firmware.
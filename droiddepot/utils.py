@@ -16,12 +16,29 @@ def int_to_hex(num: int) -> str:
         str: The hexadecimal string representation of the integer.
     """
 
+    if 0 <= num <= 0xff:
+        return f"{num:02x}"
+
     hex_str = hex(num)[2:]  # Get the hex string without the '0x' prefix
     if len(hex_str) % 2 != 0:
         hex_str = "0" + hex_str
     
     return hex_str
 
+def int_to_hex_bytes(num: int, nbytes: int) -> str:
+    """
+    Converts an integer to a fixed width big endian hexadecimal string.
+
+    Args:
+        num (int): The integer to be converted to a hexadecimal string.
+        nbytes (int): The number of bytes the integer is encoded as.
+
+    Returns:
+        str: The hexadecimal string representation of the integer, two characters per byte.
+    """
+
+    return num.to_bytes(nbytes, "big").hex()
+
 def hex_to_int(hex_str: str) -> int:
     """
     Converts a hexadecimal string to an integer.
@@ -46,6 +63,10 @@ def dbm_to_hex(dbm_val: int) -> str:
         str: The hex integer string corresponding to the input dBm value.
     """
         
+    hex_str = _DBM_TO_HEX.get(dbm_val)
+    if hex_str is not None:
+        return hex_str
+
     dbm_val = int((dbm_val - 0x80) / -1)
     return int_to_hex(dbm_val)
 
@@ -60,10 +81,18 @@ def hex_to_dbm(hex_str: str) -> float:
         float: The dBm value corresponding to the input hex integer string.
     """
 
+    dbm_val = _HEX_TO_DBM.get(hex_str)
+    if dbm_val is not None:
+        return dbm_val
+
     # Convert the hex integer string to an integer value
     hex_int = int(hex_str, 16)
 
     # Calculate the dBm value based on the provided range
     dbm_val = (hex_int - 0x80) * -1
 
-    return dbm_val
\ No newline at end of file
+    return dbm_val
+
+# Precomputed conversions for every single byte dBm value
+_DBM_TO_HEX = {dbm_val: int_to_hex(0x80 - dbm_val) for dbm_val in range(-128, 128)}
+_HEX_TO_DBM = {f"{hex_int:02x}": (hex_int - 0x80) * -1 for hex_int in range(256)}
\ No newline at end of file
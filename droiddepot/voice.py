@@ -25,6 +25,16 @@ class DroidVoiceTone(object):
     Indifferent = 2
     Upset = 3
 
+_FRIENDLY_VOICE_BANKS = {
+    DroidAffiliation.Resistenace: DroidAudioBankIdentifier.ResistenceAudioBank,
+    DroidAffiliation.FirstOrder: DroidAudioBankIdentifier.FirstOrderAudioBank
+}
+
+_UPSET_VOICE_BANKS = {
+    DroidAffiliation.Resistenace: DroidAudioBankIdentifier.FirstOrderAudioBank,
+    DroidAffiliation.FirstOrder: DroidAudioBankIdentifier.ResistenceAudioBank
+}
+
 class DroidVoiceController(object):
     """
     Experimental voice controller for SWGE droids that attempts to match the droid's configured affiliation
@@ -34,38 +44,37 @@ class DroidVoiceController(object):
     def __init__(self, droid: object) -> None:
         self.droid = droid
 
+        # Talking banks that are not "upset" for each affiliation. Affiliations without
+        # an upset bank may use any of the talking banks.
+        talking_banks = tuple(DroidAudioBankIdentifier.TalkingBanks)
+        self.__indifferent_voice_banks = {
+            affiliation_id: tuple(bank for bank in talking_banks if bank != upset_bank)
+            for affiliation_id, upset_bank in _UPSET_VOICE_BANKS.items()
+        }
+        self.__talking_voice_banks = talking_banks
+
     def get_friendly_voice_bank_id(self) -> int:
         """
         Returns a voice bank id for the droid's configuration that can be viewed as "happy" or "excited"
         """
 
-        if self.droid.affiliation_id == DroidAffiliation.Resistenace:
-            return DroidAudioBankIdentifier.ResistenceAudioBank
-        elif self.droid.affiliation_id == DroidAffiliation.FirstOrder:
-            return DroidAudioBankIdentifier.FirstOrderAudioBank
-        else:
-            return self.get_random_indifferent_voice_bank_id()
+        bank_id = _FRIENDLY_VOICE_BANKS.get(self.droid.affiliation_id)
+        return bank_id if bank_id is not None else self.get_random_indifferent_voice_bank_id()
 
     def get_upset_voice_bank_id(self) -> int:
         """
         Returns a voice bank id for the droids configuration that can be viewed as "upset" or "scared"
         """
 
-        if self.droid.affiliation_id == DroidAffiliation.Resistenace:
-            return DroidAudioBankIdentifier.FirstOrderAudioBank
-        elif self.droid.affiliation_id == DroidAffiliation.FirstOrder:
-            return DroidAudioBankIdentifier.ResistenceAudioBank
-        else:
-            return self.get_random_indifferent_voice_bank_id()
+        bank_id = _UPSET_VOICE_BANKS.get(self.droid.affiliation_id)
+        return bank_id if bank_id is not None else self.get_random_indifferent_voice_bank_id()
         
     def get_random_indifferent_voice_bank_id(self) -> int:
         """
         Returns a random voice bank that can be viewed as "neutral" or indifferent
         """
 
-        options = list(DroidAudioBankIdentifier.TalkingBanks)
-        if self.droid.affiliation_id != DroidAffiliation.Scoundrel:
-            options.remove(self.get_upset_voice_bank_id())
+        options = self.__indifferent_voice_banks.get(self.droid.affiliation_id, self.__talking_voice_banks)
         return random.choice(options)
 
     async def talk_with_animation(self, tone: int) -> None:
@@ -1,18 +1,29 @@
 """
 """
 
-import sys
-sys.path.insert(0, '../')
-
-from droiddepot.connection import discover_droid, DroidCommandId
-from droiddepot.audio import DroidLedIdentifier
-from time import sleep
-from bleak import BleakError
 import asyncio
+import functools
 import inspect
 import ast
 
+@functools.lru_cache(maxsize=256)
+def _argspec(func) -> inspect.FullArgSpec:
+    return inspect.getfullargspec(func)
+
+_FAST_ARGUMENT_CASTS = {
+    int: int,
+    float: float,
+    bool: lambda argument: argument.strip().lower() in ("true", "1")
+}
+
 def cast_argument(argument, arg_type):
+    fast_cast = _FAST_ARGUMENT_CASTS.get(arg_type)
+    if fast_cast is not None:
+        try:
+            return fast_cast(argument)
+        except ValueError:
+            pass
+
     try:
         return ast.literal_eval(argument)
     except ValueError:
@@ -23,7 +34,7 @@ async def execute_service_command(service_component: object, func_name: str, arg
         raise ValueError("Function name (%s) not found on object %s" % (func_name, service_component.__class__.__name__))
 
     func_inst = getattr(service_component, func_name)
-    argspec = inspect.getfullargspec(func_inst)
+    argspec = _argspec(getattr(func_inst, '__func__', func_inst))
     params = argspec.args[1:]  # Ignore "self" parameter
     
     if len(arguments) < len(params):
@@ -51,12 +62,24 @@ def get_service_command_args(input_list: list) -> list:
         return []
 
 async def main() -> None:
+    # Imported here so the BLE stack is only loaded once the CLI is actually started
+    from droiddepot.connection import discover_droid
+    from bleak import BleakError
+
     droid = await discover_droid(retry=True)
 
     async with droid as d:
         try:
             await d.motor_controller.center_head()
 
+            service_components = {
+                "connection": d,
+                "audio": d.audio_controller,
+                "script": d.script_engine,
+                "motor": d.motor_controller,
+                "voice": d.voice_controller
+            }
+
             while d.droid.is_connected:            
                 command = input("Command:")
                 command_parts = command.split(',')
@@ -68,19 +91,13 @@ async def main() -> None:
                 service_component_method = command_parts[1]
                 service_command_parts = get_service_command_args(command_parts)
 
+                service_component = service_components.get(service_component_name)
+                if service_component is None:
+                    print('Unknown service component: %s' % service_component_name)
+                    continue
+
                 try:
-                    if service_component_name == "connection":
-                        await execute_service_command(d, service_component_method, service_command_parts)
-                    elif service_component_name == "audio":
-                        await execute_service_command(d.audio_controller, service_component_method, service_command_parts)
-                    elif service_component_name == "script":
-                        await execute_service_command(d.script_engine, service_component_method, service_command_parts)
-                    elif service_component_name == "motor":
-                        await execute_service_command(d.motor_controller, service_component_method, service_command_parts)
-                    elif service_component_name == "voice":
-                        await execute_service_command(d.voice_controller, service_component_method, service_command_parts)
-                    else:
-                        print('Unknown service component: %s' % service_component_name)
+                    await execute_service_command(service_component, service_component_method, service_command_parts)
                 except ValueError as err:
                     print(err)
                 except SyntaxError as err:
@@ -1,13 +1,9 @@
 """
 """
 
-import sys
-sys.path.insert(0, '../')
-
 from random import randrange
 from droiddepot.connection import discover_droid, DroidCommandId
 from droiddepot.script import DroidScripts
-from time import sleep
 from bleak import BleakError
 import asyncio
 
@@ -23,7 +19,7 @@ async def main() -> None:
             d.script_engine.start_beacon_reactions()
 
             while d.droid.is_connected:
-                sleep(1)
+                await asyncio.sleep(1)
             
     except OSError as err:
         print(f"Discovery failed due to operating system: {err}")
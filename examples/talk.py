@@ -1,32 +1,75 @@
 """
 """
 
-import sys
-sys.path.insert(0, '../')
-
 from random import randrange
-from droiddepot.connection import discover_droid, DroidCommandId
+from pathlib import Path
+from droiddepot.connection import discover_droid, find_droid, DroidCommandId
 from droiddepot.script import DroidScripts
-from time import sleep
 from bleak import BleakError
 import asyncio
 
+# Address of the last droid we connected to. Used to skip a full discovery scan on the next run
+cached_address_path = Path.home() / ".pydroid_last.addr"
+
+def load_cached_address() -> str:
+    """
+    Returns the address of the last droid connected to or None if there is not one
+    """
+
+    try:
+        return cached_address_path.read_text(encoding='utf-8').strip() or None
+    except OSError:
+        return None
+
+def save_cached_address(address: str) -> None:
+    """
+    Stores the address of the connected droid for the next run
+    """
+
+    try:
+        cached_address_path.write_text(address, encoding='utf-8')
+    except OSError as err:
+        print(f"Failed to cache droid address: {err}")
+
+async def talk(droid: object) -> None:
+    """
+    Plays a random script and recenters the droid's head every 10-30 seconds
+    """
+
+    while True:
+        await droid.script_engine.execute_script(randrange(1, 7))
+        await asyncio.sleep(2)
+        await droid.motor_controller.center_head()
+        
+        await asyncio.sleep(randrange(10, 30))
+
 async def main() -> None:
     """
     Main entry point into the example application
     """
 
-    droid = await discover_droid(retry=True)
+    droid = None
+    cached_address = load_cached_address()
+    if cached_address is not None:
+        droid = await find_droid(cached_address)
+
+    if droid is None:
+        droid = await discover_droid(retry=True)
+
     try:
         async with droid as d:
+            save_cached_address(d.droid.address)
             await d.audio_controller.set_volume(20)
             
-            while d.droid.is_connected:
-                await d.script_engine.execute_script(randrange(1, 7))
-                sleep(2)
-                await d.motor_controller.center_head()
-                
-                sleep(randrange(10, 30))
+            # Talk until the droid disconnects rather than polling the connection state
+            talk_task = asyncio.create_task(talk(d))
+            disconnect_task = asyncio.create_task(d.wait_for_disconnect())
+            done, pending = await asyncio.wait((talk_task, disconnect_task), return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+
+            if talk_task in done:
+                talk_task.result()
             
     except OSError as err:
         print(f"Discovery failed due to operating system: {err}")
@@ -5,7 +5,7 @@ except ImportError:
 
 from pathlib import Path
 repository_directory = Path(__file__).parent
-long_description = (repository_directory / "README.md").read_text()
+long_description = (repository_directory / "README.md").read_text(encoding="utf-8")
 
 setup(
     name='pyDroidDepot',